@@ -3,14 +3,33 @@ import os
 import csv
 import argparse
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
+from xml.parsers import expat
 import logging
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, Iterator, List, Tuple
 import sys
+import shutil
+import tempfile
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import time
-from concurrent.futures import ThreadPoolExecutor
+import threading
+from collections import deque
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+try:
+    from lxml import etree as LET
+except ImportError:  # lxml is optional, fall back to the standard library
+    LET = ET
+
+HAS_LXML = LET is not ET
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None
 
 logging.basicConfig(
     level=logging.INFO,
@@ -19,146 +38,386 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def find_resx_files(root_folder: str) -> List[str]:
+# Columns of the exported CSV file
+CSV_FIELDS = ('file', 'key', 'value', 'comment')
+
+class StringTable:
+    """
+    String resources stored column-wise, as four parallel lists.
+
+    Rows are only assembled when they are written out, so no container is
+    allocated per string while the table is being built.
+    """
+    __slots__ = ('files', 'keys', 'values', 'comments')
+
+    def __init__(self):
+        self.files = []
+        self.keys = []
+        self.values = []
+        self.comments = []
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def append(self, file: str, key: str, value: str, comment: str) -> None:
+        """Add a single string resource"""
+        self.files.append(file)
+        self.keys.append(key)
+        self.values.append(value)
+        self.comments.append(comment)
+
+    def rows(self) -> Iterator[Tuple[str, str, str, str]]:
+        """Iterate over the table as (file, key, value, comment) rows"""
+        return zip(self.files, self.keys, self.values, self.comments)
+
+def find_resx_files(root_folder: str) -> Iterator[str]:
     """
     Recursively find all .resx files in the given folder and its subfolders.
 
+    Uses os.scandir() so the file type reported by the directory listing is
+    reused instead of issuing a separate stat() call for every entry.
+
     Args:
         root_folder: The root folder to start searching from
 
-    Returns:
-        A list of paths to .resx files
+    Yields:
+        Paths to .resx files
     """
-    resx_files = []
     logger.info(f"Scanning {root_folder} for .resx files...")
 
-    for dirpath, _, filenames in os.walk(root_folder):
-        for filename in filenames:
-            if filename.lower().endswith('.resx'):
-                resx_files.append(os.path.join(dirpath, filename))
+    stack = [root_folder]
+    while stack:
+        folder = stack.pop()
+        subfolders = []
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    # Walk folders whatever their name; check the suffix
+                    # before is_file() so most files never need a stat
+                    if entry.is_dir(follow_symlinks=False):
+                        subfolders.append(entry.path)
+                    elif entry.name.lower().endswith('.resx') and entry.is_file():
+                        yield entry.path
+        except OSError as e:
+            # Mirror os.walk, which silently skips unreadable folders
+            logger.debug(f"Skipping {folder}: {str(e)}")
+            continue
 
-    logger.info(f"Found {len(resx_files)} .resx files")
-    return resx_files
+        # Push in reverse so folders are visited in listing order
+        stack.extend(reversed(subfolders))
+
+# lxml parsers must not be shared between threads, so each thread keeps its own
+_parser_local = threading.local()
 
-def extract_strings_from_resx(resx_file: str) -> List[Dict[str, str]]:
+def _get_parser():
     """
-    Extract string resources from a .resx file.
+    Return this thread's lxml parser, creating it on first use.
+
+    Reusing one parser avoids setting up a new one for every file, which
+    dominates the cost of parsing small RESX files.
+    """
+    parser = getattr(_parser_local, 'parser', None)
+    if parser is None:
+        # Drop ignorable whitespace so pretty_print can re-indent cleanly on
+        # write; RESX files don't use xml:id. Entities keep lxml's default
+        # of expanding internal ones only, so values never hold unresolved
+        # entity nodes
+        parser = LET.XMLParser(remove_blank_text=True, huge_tree=False,
+                               collect_ids=False)
+        _parser_local.parser = parser
+    return parser
+
+def _parse_resx(resx_file: str):
+    """
+    Parse a .resx file, using lxml when it is installed.
 
     Args:
         resx_file: Path to the .resx file
 
     Returns:
-        A list of dictionaries containing the string data
+        The parsed element tree
+    """
+    if HAS_LXML:
+        return LET.parse(resx_file, _get_parser())
+    return ET.parse(resx_file)
+
+def _replace_file(path: str, data: bytes) -> None:
+    """
+    Replace the contents of a file atomically, so it is never left half-written.
+
+    Args:
+        path: Path to the file; symlinks are resolved and their target replaced
+        data: The new file contents
     """
+    target = os.path.realpath(path)
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(target), prefix='.', suffix='.tmp')
     try:
-        tree = ET.parse(resx_file)
-        root = tree.getroot()
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        shutil.copymode(target, temp_path)
+        os.replace(temp_path, target)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
 
-        # Try different namespace approaches
-        namespaces = [
-            {'ns': 'http://schemas.microsoft.com/developer/msbuild/2003'},
-            {}  # Empty namespace for standard RESX files
-        ]
+# Declaration written at the top of every updated .resx file
+XML_DECLARATION = b'<?xml version="1.0" encoding="utf-8"?>\n'
+
+def _write_resx(tree, resx_file: str) -> bool:
+    """
+    Write an element tree back to a .resx file with indentation.
+
+    Args:
+        tree: The element tree to write
+        resx_file: Path to the .resx file
+
+    Returns:
+        False if the file already had exactly this content and was left alone
+    """
+    if HAS_LXML:
+        # Write the declaration ourselves; lxml would single-quote its attributes
+        pretty_xml = XML_DECLARATION + LET.tostring(tree.getroot(), pretty_print=True, encoding='utf-8')
+    else:
+        # Re-indent in place rather than re-parsing the output into a second DOM
+        ET.indent(tree, space="  ")
+        pretty_xml = XML_DECLARATION + ET.tostring(tree.getroot(), encoding='utf-8', xml_declaration=False) + b'\n'
+
+    with open(resx_file, 'rb') as f:
+        if f.read() == pretty_xml:
+            return False
+
+    _replace_file(resx_file, pretty_xml)
+    return True
+
+def _iter_data_elements(resx_file: str) -> Iterator:
+    """
+    Stream the <data> elements of a .resx file without building the full tree.
+
+    Each element is cleared once the caller has moved on, so memory use stays
+    flat regardless of the file size.
+
+    Args:
+        resx_file: Path to the .resx file
+
+    Yields:
+        <data> elements, in document order
+    """
+    if HAS_LXML:
+        # {*} matches <data> both with and without a default namespace
+        for _, elem in LET.iterparse(resx_file, events=('end',), tag='{*}data', huge_tree=False,
+                                     recover=True, collect_ids=False):
+            yield elem
+            elem.clear()
+            # Drop already processed siblings so the root does not keep growing
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+        return
+
+    for _, elem in ET.iterparse(resx_file, events=('end',)):
+        if elem.tag == 'data' or elem.tag.endswith('}data'):
+            yield elem
+            elem.clear()
+
+class _UnusualResxLayout(Exception):
+    """Raised by the expat extractor for layouts it leaves to the tree parsers"""
+
+def _extract_with_expat(resx_file: str) -> List[Tuple[str, str, str, str]]:
+    """
+    Extract string resources from a .resx file with a bare expat parser.
+
+    No element tree is built: the handlers only track whether the parser is
+    inside a <data> element's <value> or <comment> and collect that text.
 
-        # Extract the default namespace if it exists
-        if root.tag.startswith('{'):
-            ns = root.tag.split('}')[0].strip('{')
-            namespaces.insert(0, {'ns': ns})
-
-        # Try to find data elements with different namespace approaches
-        data_elements = []
-        for ns in namespaces:
-            if not ns:  # Empty namespace
-                elements = root.findall('.//data')
-                if elements:
-                    data_elements = elements
-                    break
+    Args:
+        resx_file: Path to the .resx file
+
+    Returns:
+        A list of (file, key, value, comment) tuples
+
+    Raises:
+        expat.ExpatError: If the file is not well-formed XML
+        _UnusualResxLayout: If elements are nested where RESX files have none
+    """
+    results = []
+    text = []
+    depth = 0
+    data_depth = None  # Depth of the open <data> element, if any
+    target = None  # 'value' or 'comment' while collecting their text
+    name = value = comment = None
+
+    def start_element(tag, attrs):
+        nonlocal depth, data_depth, target, name, value, comment
+        depth += 1
+        local_name = tag.rpartition(' ')[2]
+
+        if target is not None:
+            raise _UnusualResxLayout(f"<{local_name}> inside <{target}>")
+
+        if local_name == 'data':
+            if data_depth is not None:
+                raise _UnusualResxLayout("<data> inside <data>")
+            data_depth = depth
+            name = attrs.get('name')
+            value = comment = None
+        elif data_depth is not None and depth == data_depth + 1:
+            # Like find(), only the first <value> and <comment> count
+            if (local_name == 'value' and value is None) or (local_name == 'comment' and comment is None):
+                target = local_name
+                text.clear()
+
+    def end_element(tag):
+        nonlocal depth, data_depth, target, value, comment
+        if target is not None:
+            if target == 'value':
+                value = ''.join(text)
             else:
-                elements = root.findall('.//ns:data', ns)
-                if elements:
-                    data_elements = elements
-                    namespaces = [ns]  # Use this namespace for subsequent searches
-                    break
-
-        # If still no elements found, try direct xpath
-        if not data_elements:
-            data_elements = root.findall('./data')
-
-        # Log the number of data elements found for debugging
-        logger.debug(f"Found {len(data_elements)} data elements in {resx_file}")
-
-        results = []
-        for data_element in data_elements:
-            name = data_element.get('name')
-            if name is None:
-                continue
+                comment = ''.join(text)
+            target = None
+        elif depth == data_depth:
+            if name is not None and value is not None:
+                results.append((resx_file, name, value, comment or ""))
+            data_depth = None
+        depth -= 1
+
+    def character_data(data):
+        if target is not None:
+            text.append(data)
+
+    parser = expat.ParserCreate(namespace_separator=' ')
+    # Deliver each run of text in one call instead of one per line or entity
+    parser.buffer_text = True
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    parser.CharacterDataHandler = character_data
+
+    with open(resx_file, 'rb') as f:
+        parser.ParseFile(f)
+
+    return results
+
+def extract_strings_from_resx(resx_file: str) -> Iterator[Tuple[str, str, str, str]]:
+    """
+    Extract string resources from a .resx file.
 
-            # Get value element
-            value_element = None
-            for ns in namespaces:
-                if not ns:  # Empty namespace
-                    value_element = data_element.find('./value')
-                else:
-                    value_element = data_element.find('./ns:value', ns)
+    Strings are yielded as they are parsed, so callers can process them
+    without holding the whole file in memory.
 
-                if value_element is not None:
-                    break
+    Args:
+        resx_file: Path to the .resx file
 
-            # If value element exists and has text (or empty text)
-            if value_element is not None:
-                # Get text or empty string
-                value_text = value_element.text if value_element.text is not None else ""
-
-                # Get comment element if it exists
-                comment_element = None
-                for ns in namespaces:
-                    if not ns:  # Empty namespace
-                        comment_element = data_element.find('./comment')
-                    else:
-                        comment_element = data_element.find('./ns:comment', ns)
-
-                    if comment_element is not None:
-                        break
-
-                comment = ""
-                if comment_element is not None and comment_element.text is not None:
-                    comment = comment_element.text
-
-                results.append({
-                    'file': resx_file,
-                    'key': name,
-                    'value': value_text,
-                    'comment': comment
-                })
-
-        logger.debug(f"Extracted {len(results)} strings from {resx_file}")
-        return results
+    Yields:
+        (file, key, value, comment) tuples
+    """
+    # Every entry refers to the same path, so share a single string object
+    resx_file = sys.intern(resx_file)
+
+    # Fast path: expat callbacks without building any tree
+    try:
+        yield from _extract_with_expat(resx_file)
+        return
+    except _UnusualResxLayout as e:
+        logger.debug(f"Using the tree parser for {resx_file}: {str(e)}")
+    except expat.ExpatError as e:
+        if HAS_LXML:
+            # lxml recovers what it can from malformed files, so say so loudly
+            logger.warning(f"{resx_file} is not well-formed XML ({str(e)}), "
+                           f"exporting the strings that can be recovered")
+        else:
+            logger.debug(f"Using the tree parser for {resx_file}: {str(e)}")
+
+    value_tag = comment_tag = None
+    for data_element in _iter_data_elements(resx_file):
+        name = data_element.get('name')
+        if name is None:
+            continue
+
+        # Child elements share the namespace of the <data> elements, so
+        # resolve their tags once per file
+        if value_tag is None:
+            ns_prefix = data_element.tag[:data_element.tag.find('}') + 1]
+            value_tag = f"{ns_prefix}value"
+            comment_tag = f"{ns_prefix}comment"
+
+        # Skip entries without a value element
+        value_element = data_element.find(value_tag)
+        if value_element is None:
+            continue
+
+        # Get text or empty string
+        value_text = value_element.text if value_element.text is not None else ""
+
+        comment = ""
+        comment_element = data_element.find(comment_tag)
+        if comment_element is not None and comment_element.text is not None:
+            comment = comment_element.text
+
+        yield resx_file, name, value_text, comment
+
+def _extract_table(resx_file: str) -> StringTable:
+    """
+    Collect the strings of a .resx file into a StringTable.
+
+    Used by the export worker processes; the columnar table is cheaper to send
+    back to the parent than one tuple per string.
+
+    Args:
+        resx_file: Path to the .resx file
+
+    Returns:
+        A StringTable with the string data, empty if the file could not be read
+    """
+    results = StringTable()
+    try:
+        for row in extract_strings_from_resx(resx_file):
+            results.append(*row)
     except Exception as e:
         logger.error(f"Error extracting strings from {resx_file}: {str(e)}")
-        return []
+        return StringTable()
+
+    logger.debug(f"Extracted {len(results)} strings from {resx_file}")
+    return results
 
-def export_to_csv(strings_data: List[Dict[str, str]], output_file: str) -> None:
+def export_to_csv(tables: Iterable[StringTable], output_file: str) -> int:
     """
     Export the extracted string data to a CSV file.
 
+    Each table is written as soon as it arrives instead of collecting them
+    all first. The rows go to a temporary file that only replaces
+    output_file if at least one string was exported, so an existing file is
+    never lost to an empty or failed export.
+
     Args:
-        strings_data: List of dictionaries containing string data
+        tables: StringTables containing the string data, e.g. one per .resx file
         output_file: Path to the output CSV file
+
+    Returns:
+        The number of strings written
     """
+    temp_output_file = f"{output_file}.temp"
     try:
-        fieldnames = ['file', 'key', 'value', 'comment']
-
-        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(strings_data)
+        count = 0
+        with open(temp_output_file, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(CSV_FIELDS)
+            for table in tables:
+                writer.writerows(table.rows())
+                count += len(table)
+
+        if not count:
+            # Don't leave a header-only CSV behind
+            os.remove(temp_output_file)
+            return 0
 
-        logger.info(f"Exported {len(strings_data)} strings to {output_file}")
+        os.replace(temp_output_file, output_file)
+        logger.info(f"Exported {count} strings to {output_file}")
+        return count
     except Exception as e:
         logger.error(f"Error exporting to CSV: {str(e)}")
+        if os.path.exists(temp_output_file):
+            os.remove(temp_output_file)
         raise
 
-def parse_csv(csv_file: str) -> Dict[str, Dict[str, Dict[str, str]]]:
+def parse_csv(csv_file: str) -> Dict[Tuple[str, str], Tuple[str, str]]:
     """
     Parse the CSV file containing the modified strings.
 
@@ -166,132 +425,110 @@ def parse_csv(csv_file: str) -> Dict[str, Dict[str, Dict[str, str]]]:
         csv_file: Path to the CSV file
 
     Returns:
-        A nested dictionary mapping file -> key -> {value, comment}
+        A dictionary mapping (file, key) -> (value, comment)
     """
     result = {}
 
     try:
         with open(csv_file, 'r', newline='', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
+            reader = csv.reader(csvfile)
+            header = next(reader, [])
+            idx = {name: i for i, name in enumerate(header)}
+
+            # Missing columns point past the end of the row and read as empty,
+            # the same as the cells of a short row
+            file_idx, key_idx, value_idx, comment_idx = (idx.get(name, len(header)) for name in CSV_FIELDS)
+            row_width = max(file_idx, key_idx, value_idx, comment_idx) + 1
 
             for row in reader:
-                file_path = row.get('file', '')
-                key = row.get('key', '')
-                value = row.get('value', '')
-                comment = row.get('comment', '')
+                if len(row) < row_width:
+                    row.extend([''] * (row_width - len(row)))
+
+                file_path = row[file_idx]
+                key = row[key_idx]
+                value = row[value_idx]
+                comment = row[comment_idx]
 
                 if not file_path or not key:
                     continue
 
-                if file_path not in result:
-                    result[file_path] = {}
-
-                result[file_path][key] = {
-                    'value': value,
-                    'comment': comment
-                }
+                # Paths repeat on every row of a file and keys across
+                # languages, keep a single copy of each
+                result[(sys.intern(file_path), sys.intern(key))] = (value, comment)
 
-        logger.info(f"Parsed {sum(len(keys) for keys in result.values())} strings from {csv_file}")
+        logger.info(f"Parsed {len(result)} strings from {csv_file}")
         return result
     except Exception as e:
         logger.error(f"Error parsing CSV file: {str(e)}")
         raise
 
-def update_resx_file(resx_file: str, string_data: Dict[str, Dict[str, str]]) -> None:
+def update_resx_file(resx_file: str, string_data: Dict[Tuple[str, str], Tuple[str, str]]) -> None:
     """
     Update a .resx file with modified strings.
 
     Args:
         resx_file: Path to the .resx file
-        string_data: Dictionary mapping key -> {value, comment}
+        string_data: Dictionary mapping (file, key) -> (value, comment), as
+            returned by parse_csv; only the entries for resx_file are used
     """
     try:
         # Parse the RESX file
-        tree = ET.parse(resx_file)
+        tree = _parse_resx(resx_file)
         root = tree.getroot()
 
-        # Try different namespace approaches
-        namespaces = [
-            {'ns': 'http://schemas.microsoft.com/developer/msbuild/2003'},
-            {}  # Empty namespace for standard RESX files
-        ]
-
-        # Extract the default namespace if it exists
-        if root.tag.startswith('{'):
-            ns = root.tag.split('}')[0].strip('{')
-            namespaces.insert(0, {'ns': ns})
-
-        # Find all data elements
-        data_elements = []
-        active_namespace = None
-
-        for ns in namespaces:
-            if not ns:  # Empty namespace
-                elements = root.findall('.//data')
-            else:
-                elements = root.findall('.//ns:data', ns)
-
-            if elements:
-                data_elements = elements
-                active_namespace = ns
-                break
-
-        # If still no elements found, try direct xpath
-        if not data_elements:
-            data_elements = root.findall('./data')
-            active_namespace = {}
+        # Resolve the document namespace once instead of probing per element
+        ns_uri = root.tag[1:root.tag.index('}')] if root.tag.startswith('{') else ''
+        ns_prefix = f"{{{ns_uri}}}" if ns_uri else ""
+        data_tag = f"{ns_prefix}data"
+        value_tag = f"{ns_prefix}value"
+        comment_tag = f"{ns_prefix}comment"
 
         # Track changes
         changes_count = 0
 
-        for data_element in data_elements:
-            name = data_element.get('name')
-            if name and name in string_data:
-                # Get and update value element
-                value_element = None
-
-                if not active_namespace:  # Empty namespace
-                    value_element = data_element.find('./value')
-                else:
-                    value_element = data_element.find('./ns:value', active_namespace)
-
-                if value_element is not None:
-                    old_value = value_element.text if value_element.text is not None else ""
-                    new_value = string_data[name]['value']
-                    if old_value != new_value:
-                        value_element.text = new_value
-                        changes_count += 1
-
-                # Update comment if it exists
-                comment = string_data[name]['comment']
-                if comment:
-                    comment_element = None
-
-                    if not active_namespace:  # Empty namespace
-                        comment_element = data_element.find('./comment')
-                    else:
-                        comment_element = data_element.find('./ns:comment', active_namespace)
-
-                    # Create comment element if it doesn't exist
-                    if comment_element is None:
-                        if active_namespace and 'ns' in active_namespace:
-                            ns_prefix = f"{{{active_namespace['ns']}}}" if active_namespace['ns'] else ""
-                            comment_element = ET.SubElement(data_element, f"{ns_prefix}comment")
-                        else:
-                            comment_element = ET.SubElement(data_element, "comment")
-
-                    old_comment = comment_element.text if comment_element.text is not None else ""
-                    if old_comment != comment:
-                        comment_element.text = comment
-                        changes_count += 1
-
-        # Write back to file with proper formatting
-        xmlstr = ET.tostring(root, encoding='utf-8')
-        parsed_xml = minidom.parseString(xmlstr)
-        pretty_xml = parsed_xml.toprettyxml(indent="  ", encoding='utf-8')
-
-        with open(resx_file, 'wb') as f:
-            f.write(pretty_xml)
+        for data_element in root.iter(data_tag):
+            # Entries without an update are skipped before any other work
+            entry = string_data.get((resx_file, data_element.get('name')))
+            if entry is None:
+                continue
+            new_value, comment = entry
+
+            # Pick out the value and comment in a single pass over the
+            # children, which is cheaper than a lookup for each of them
+            value_element = comment_element = None
+            for child in data_element:
+                tag = child.tag
+                if tag == value_tag:
+                    if value_element is None:
+                        value_element = child
+                        # Without a new comment there is nothing else to find
+                        if not comment:
+                            break
+                elif comment and tag == comment_tag and comment_element is None:
+                    comment_element = child
+
+            # Update value element
+            if value_element is not None:
+                old_value = value_element.text if value_element.text is not None else ""
+                if old_value != new_value:
+                    value_element.text = new_value
+                    changes_count += 1
+
+            # Update comment if it exists
+            if comment:
+                # Create comment element if it doesn't exist
+                if comment_element is None:
+                    comment_element = LET.SubElement(data_element, comment_tag)
+
+                old_comment = comment_element.text if comment_element.text is not None else ""
+                if old_comment != comment:
+                    comment_element.text = comment
+                    changes_count += 1
+
+        # Leave files without changes untouched
+        if changes_count == 0 or not _write_resx(tree, resx_file):
+            logger.info(f"{resx_file} unchanged, skipping write")
+            return
 
         logger.info(f"Updated {resx_file} with {changes_count} changes")
     except Exception as e:
@@ -300,80 +537,151 @@ def update_resx_file(resx_file: str, string_data: Dict[str, Dict[str, str]]) ->
 
 # Translation Methods
 
-def translate_with_google(text, source_lang, target_lang, api_key):
+# Timeout in seconds for a single translation API request
+HTTP_TIMEOUT = 30
+
+# Connections kept open per API host, which also caps --concurrency
+HTTP_POOL_SIZE = 32
+
+# One session for all translation requests, so HTTPS connections are kept
+# alive and reused. Rate limiting and transient server errors are retried
+# with exponential backoff (0, 5 and 10 seconds), honouring Retry-After.
+# Failures after the request was sent are not retried, since the provider
+# may already have processed (and billed) it.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=HTTP_POOL_SIZE,
+    max_retries=Retry(
+        total=3,
+        read=0,
+        other=0,
+        backoff_factor=2.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=None,  # Translation requests are POSTs
+        raise_on_status=False
+    )
+))
+
+def _json_dumps(obj) -> bytes:
+    """Encode a translation API request body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+def _json_loads(data: bytes):
+    """Decode a translation API response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Maximum number of texts the APIs accept in a single request
+GOOGLE_MAX_TEXTS = 128
+DEEPL_MAX_TEXTS = 50
+
+def _translate_non_blank(texts: List[str], max_texts: int, translate_chunk) -> List[str]:
     """
-    Translate text using Google Cloud Translation API.
+    Translate the non-blank entries of a list in chunks, leaving blank ones untouched.
 
     Args:
-        text: Text to translate
+        texts: Texts to translate
+        max_texts: Maximum number of texts per call to translate_chunk
+        translate_chunk: Function translating a list of texts in one request
+
+    Returns:
+        List of translated texts, in the same order, with None for texts
+        that could not be translated
+    """
+    pending = [i for i, text in enumerate(texts) if text.strip()]
+    results = list(texts)
+    for i in pending:
+        results[i] = None
+
+    for chunk_start in range(0, len(pending), max_texts):
+        chunk = pending[chunk_start:chunk_start + max_texts]
+        for i, translated in zip(chunk, translate_chunk([texts[i] for i in chunk])):
+            results[i] = translated
+
+    return results
+
+def translate_with_google(texts, source_lang, target_lang, api_key):
+    """
+    Translate texts using Google Cloud Translation API.
+
+    Args:
+        texts: List of texts to translate
         source_lang: Source language code
         target_lang: Target language code
         api_key: Google Cloud API key
 
     Returns:
-        Translated text
+        List of translated texts, in the same order, with None for texts
+        that could not be translated
     """
-    if not text.strip():
-        return text
-
     url = f"https://translation.googleapis.com/language/translate/v2?key={api_key}"
-    payload = {
-        'q': text,
-        'source': source_lang,
-        'target': target_lang,
-        'format': 'text'
-    }
 
-    try:
-        response = requests.post(url, data=payload)
-        if response.status_code == 200:
-            result = response.json()
-            return result['data']['translations'][0]['translatedText']
-        else:
-            logger.error(f"Translation API error: {response.status_code} - {response.text}")
-            return text
-    except Exception as e:
-        logger.error(f"Translation error: {str(e)}")
-        return text
+    def translate_chunk(chunk):
+        # Repeated 'q' fields translate several texts in one request
+        payload = [('q', text) for text in chunk] + [
+            ('source', source_lang),
+            ('target', target_lang),
+            ('format', 'text')
+        ]
 
-def translate_with_deepl(text, source_lang, target_lang, api_key):
+        try:
+            response = _SESSION.post(url, data=payload, timeout=HTTP_TIMEOUT)
+            if response.status_code == 200:
+                result = _json_loads(response.content)
+                return [t['translatedText'] for t in result['data']['translations']]
+            else:
+                logger.error(f"Translation API error: {response.status_code} - {response.text}")
+                return [None] * len(chunk)
+        except Exception as e:
+            logger.error(f"Translation error: {str(e)}")
+            return [None] * len(chunk)
+
+    return _translate_non_blank(texts, GOOGLE_MAX_TEXTS, translate_chunk)
+
+def translate_with_deepl(texts, source_lang, target_lang, api_key):
     """
-    Translate text using DeepL API.
+    Translate texts using DeepL API.
 
     Args:
-        text: Text to translate
+        texts: List of texts to translate
         source_lang: Source language code
         target_lang: Target language code
         api_key: DeepL API key
 
     Returns:
-        Translated text
+        List of translated texts, in the same order, with None for texts
+        that could not be translated
     """
-    if not text.strip():
-        return text
-
     url = "https://api-free.deepl.com/v2/translate"
     headers = {
         "Authorization": f"DeepL-Auth-Key {api_key}"
     }
-    payload = {
-        "text": [text],
-        "source_lang": source_lang.upper(),
-        "target_lang": target_lang.upper(),
-        "preserve_formatting": 1
-    }
 
-    try:
-        response = requests.post(url, headers=headers, data=payload)
-        if response.status_code == 200:
-            result = response.json()
-            return result['translations'][0]['text']
-        else:
-            logger.error(f"DeepL API error: {response.status_code} - {response.text}")
-            return text
-    except Exception as e:
-        logger.error(f"Translation error: {str(e)}")
-        return text
+    def translate_chunk(chunk):
+        payload = {
+            "text": chunk,
+            "source_lang": source_lang.upper(),
+            "target_lang": target_lang.upper(),
+            "preserve_formatting": 1
+        }
+
+        try:
+            response = _SESSION.post(url, headers=headers, data=payload, timeout=HTTP_TIMEOUT)
+            if response.status_code == 200:
+                result = _json_loads(response.content)
+                return [t['text'] for t in result['translations']]
+            else:
+                logger.error(f"DeepL API error: {response.status_code} - {response.text}")
+                return [None] * len(chunk)
+        except Exception as e:
+            logger.error(f"Translation error: {str(e)}")
+            return [None] * len(chunk)
+
+    return _translate_non_blank(texts, DEEPL_MAX_TEXTS, translate_chunk)
 
 def translate_with_openai(text, source_lang, target_lang, api_key):
     """
@@ -386,7 +694,7 @@ def translate_with_openai(text, source_lang, target_lang, api_key):
         api_key: OpenAI API key
 
     Returns:
-        Translated text
+        Translated text, or None if the text could not be translated
     """
     if not text.strip():
         return text
@@ -412,18 +720,80 @@ def translate_with_openai(text, source_lang, target_lang, api_key):
     }
 
     try:
-        response = requests.post(url, headers=headers, json=payload)
+        response = _SESSION.post(url, headers=headers, data=_json_dumps(payload), timeout=HTTP_TIMEOUT)
         if response.status_code == 200:
-            result = response.json()
+            result = _json_loads(response.content)
             return result['choices'][0]['message']['content'].strip()
         else:
             logger.error(f"OpenAI API error: {response.status_code} - {response.text}")
-            return text
+            return None
     except Exception as e:
         logger.error(f"Translation error: {str(e)}")
-        return text
+        return None
 
-def translate_csv(input_file, output_file, source_lang, target_lang, api_type, api_key, batch_size=3, delay=2, start_at=0):
+def _bounded_map(executor, func, items, window):
+    """
+    Like executor.map, but keeps at most `window` tasks queued ahead of the consumer.
+
+    Results are yielded in the order of `items`. Unlike executor.map, an
+    interrupted run only has to wait for the few tasks already queued.
+
+    Args:
+        executor: The executor to submit tasks to
+        func: Function to apply to each item
+        items: Iterable of items to process
+        window: Maximum number of outstanding tasks
+
+    Yields:
+        func(item) for each item, in order
+    """
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(func, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+
+    while pending:
+        yield pending.popleft().result()
+
+# Number of new cache entries after which the translation cache is saved
+CACHE_SAVE_INTERVAL = 100
+
+def _load_translation_cache(cache_file: str) -> Dict[str, Dict[str, str]]:
+    """
+    Load a translation cache written by a previous run.
+
+    Args:
+        cache_file: Path to the JSON cache file
+
+    Returns:
+        A dictionary mapping "api:source:target" -> source text -> translation
+    """
+    if not os.path.exists(cache_file):
+        return {}
+
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable translation cache {cache_file}: {str(e)}")
+        return {}
+
+def _save_translation_cache(cache_file: str, cache_data: Dict[str, Dict[str, str]]) -> None:
+    """
+    Save the translation cache, replacing the previous file atomically.
+
+    Args:
+        cache_file: Path to the JSON cache file
+        cache_data: A dictionary mapping "api:source:target" -> source text -> translation
+    """
+    temp_cache_file = f"{cache_file}.tmp"
+    with open(temp_cache_file, 'w', encoding='utf-8') as f:
+        json.dump(cache_data, f, ensure_ascii=False)
+    os.replace(temp_cache_file, cache_file)
+
+def translate_csv(input_file, output_file, source_lang, target_lang, api_type, api_key, batch_size=3, delay=2, start_at=0,
+                  concurrency=1):
     """
     Translate all strings in a CSV file.
 
@@ -434,19 +804,37 @@ def translate_csv(input_file, output_file, source_lang, target_lang, api_type, a
         target_lang: Target language code or name
         api_type: 'google', 'deepl', or 'openai'
         api_key: API key for the selected service
-        batch_size: Number of texts to translate in a batch (default: 3)
+        batch_size: Number of texts to translate per API request (default: 3)
         delay: Delay between translations in seconds (default: 2)
         start_at: Start translating from this row index (default: 0)
+        concurrency: Number of batches to translate in parallel (default: 1)
     """
+    # Translated rows are appended here as they complete, and the file is
+    # moved to output_file once the whole run has finished
+    temp_output_file = f"{output_file}.temp"
+
+    # Checked before anything is read or written, so a bad value can't
+    # clobber the checkpoint of a previous run
+    if not 1 <= concurrency <= HTTP_POOL_SIZE:
+        logger.error(f"Concurrency must be between 1 and {HTTP_POOL_SIZE}, got {concurrency}")
+        return 1
+
     try:
         # Read the input CSV
-        rows = []
         with open(input_file, 'r', newline='', encoding='utf-8') as csvfile:
-            reader = csv.DictReader(csvfile)
-            fieldnames = reader.fieldnames
+            reader = csv.reader(csvfile)
+            header = next(reader)
+            # Skip blank lines, as csv.DictReader did
+            rows = [row for row in reader if row]
 
-            for row in reader:
-                rows.append(row)
+        key_idx = header.index('key')
+        value_idx = header.index('value')
+        comment_idx = header.index('comment')
+
+        # Pad short rows so every column can be indexed
+        for row in rows:
+            if len(row) < len(header):
+                row.extend([''] * (len(header) - len(row)))
 
         # If starting from a specific row
         if start_at > 0:
@@ -455,138 +843,184 @@ def translate_csv(input_file, output_file, source_lang, target_lang, api_type, a
                 return 1
             logger.info(f"Starting translation from row {start_at} (skipping {start_at} rows)")
 
-            # If continuing from a previous run, read the existing output file
-            if os.path.exists(output_file):
-                translated_rows = []
-                with open(output_file, 'r', newline='', encoding='utf-8') as csvfile:
-                    reader = csv.DictReader(csvfile)
-                    for i, row in enumerate(reader):
-                        if i < start_at:
-                            translated_rows.append(row)
+            # If continuing from a previous run, read its checkpoint (or the
+            # finished output file)
+            previous_file = temp_output_file if os.path.exists(temp_output_file) else output_file
+            if os.path.exists(previous_file):
+                with open(previous_file, 'r', newline='', encoding='utf-8') as csvfile:
+                    reader = csv.reader(csvfile)
+                    next(reader, None)
+                    translated_rows = list(islice((row for row in reader if row), start_at))
 
                 # Replace the first 'start_at' rows with the translated ones
                 if len(translated_rows) == start_at:
                     rows[:start_at] = translated_rows
 
-        logger.info(f"Translating {len(rows)} strings from {source_lang} to {target_lang}...")
+        logger.info(f"Translating {len(rows) - start_at} strings from {source_lang} to {target_lang}...")
 
-        # Select translation function
+        # Select translation function; each one takes and returns a list of
+        # texts, with None for texts that failed to translate
         if api_type == 'google':
-            translate_func = lambda text: translate_with_google(text, source_lang, target_lang, api_key)
+            translate_func = lambda texts: translate_with_google(texts, source_lang, target_lang, api_key)
         elif api_type == 'deepl':
-            translate_func = lambda text: translate_with_deepl(text, source_lang, target_lang, api_key)
+            translate_func = lambda texts: translate_with_deepl(texts, source_lang, target_lang, api_key)
         elif api_type == 'openai':
-            translate_func = lambda text: translate_with_openai(text, source_lang, target_lang, api_key)
+            translate_func = lambda texts: [translate_with_openai(text, source_lang, target_lang, api_key)
+                                            for text in texts]
         else:
             logger.error(f"Unknown API type: {api_type}")
             return 1
 
-        # Process in batches to avoid overloading the API
-        total_batches = (len(rows) + batch_size - 1) // batch_size
+        # Reuse translations of repeated strings, including those from earlier runs
+        cache_file = f"{output_file}.tcache.json"
+        cache_data = _load_translation_cache(cache_file)
+        cache = cache_data.setdefault(f"{api_type}:{source_lang}:{target_lang}", {})
+        cache_lock = threading.Lock()
+        new_entries = 0
+
+        def cached_translate(texts):
+            nonlocal new_entries
+            results = list(texts)
+
+            # Key on the stripped text so differently padded copies share an
+            # entry; the padding is put back around the translation
+            missing = {}
+            for i, text in enumerate(texts):
+                core = text.strip()
+                if not core:
+                    continue
+                translated = cache.get(core)
+                if translated is None:
+                    missing.setdefault(core, []).append(i)
+                else:
+                    results[i] = text.replace(core, translated, 1)
+
+            if missing:
+                cores = list(missing)
+                for core, translated in zip(cores, translate_func(cores)):
+                    # Failed texts are kept untranslated and retried next run
+                    if translated is None:
+                        continue
+                    with cache_lock:
+                        cache[core] = translated
+                        new_entries += 1
+                    for i in missing[core]:
+                        results[i] = texts[i].replace(core, translated, 1)
+
+            return results
+
+        def save_cache():
+            nonlocal new_entries
+            with cache_lock:
+                _save_translation_cache(cache_file, cache_data)
+                new_entries = 0
 
-        # Create an intermediate output file to save progress
-        temp_output_file = f"{output_file}.temp"
-        progress_counter = 0
+        # Process in batches to avoid overloading the API
+        batches = [(start_idx, rows[start_idx:start_idx + batch_size])
+                   for start_idx in range(start_at, len(rows), batch_size)]
+        total_batches = len(batches)
 
-        def translate_row(row):
+        def source_value(row):
             # If value is empty, create a placeholder for translation
-            value = row['value']
+            value = row[value_idx]
             if not value.strip():
                 # Look at the key to determine a reasonable placeholder
-                key_parts = row['key'].split('.')
+                key_parts = row[key_idx].split('.')
                 if len(key_parts) > 1:
                     # Use the part before .Text or similar suffix as placeholder
                     placeholder = key_parts[0].replace('ph', '').replace('_', ' ').strip()
                     if placeholder:
                         value = f"[{placeholder}]"
+            return value
+
+        def translate_batch(batch):
+            start_idx, batch_rows = batch
+            logger.info(f"Translating rows {start_idx+1}-{start_idx + len(batch_rows)} of {len(rows)}...")
+            for row in batch_rows:
+                logger.info(f"Translating: '{row[key_idx]}' - '{row[value_idx]}'")
+
+            # The whole batch goes out as one request for the values and one
+            # for the comments
+            values = [source_value(row) for row in batch_rows]
+            comments = [row[comment_idx] for row in batch_rows]
+
+            # Rate limits are retried by the HTTP session; failed texts are
+            # left untranslated
+            translated_values = cached_translate(values)
+
+            # Also translate comments if they exist
+            translated_comments = comments
+            if any(comment.strip() for comment in comments):
+                # Add delay between value and comment translation
+                time.sleep(1)
+                translated_comments = cached_translate(comments)
+
+            for row, translated_value, translated_comment in zip(batch_rows, translated_values, translated_comments):
+                row[value_idx] = translated_value
+                row[comment_idx] = translated_comment
+
+            # Add a delay between batches to avoid rate limits
+            time.sleep(delay)  # Configurable delay between requests
+
+            return batch_rows
+
+        # Create the executor first: opening the checkpoint truncates it
+        with ThreadPoolExecutor(max_workers=concurrency) as executor, \
+                open(temp_output_file, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(header)
+            writer.writerows(rows[:start_at])
+
+            # Batches complete in order, so the checkpoint always holds a
+            # contiguous run of translated rows for --start-at
+            for i, translated_batch in enumerate(_bounded_map(executor, translate_batch, batches, concurrency * 2)):
+                # Save progress after each batch
+                writer.writerows(translated_batch)
+                csvfile.flush()
+                os.fsync(csvfile.fileno())
+
+                done = batches[i][0] + len(translated_batch)
+                logger.info(f"Batch {i+1}/{total_batches} complete ({done} of {len(rows)} rows saved to {temp_output_file})")
+
+                if new_entries >= CACHE_SAVE_INTERVAL:
+                    save_cache()
+
+        os.replace(temp_output_file, output_file)
+        if new_entries:
+            save_cache()
 
-            # Add retry logic to handle API rate limits
-            max_retries = 3
-            retry_delay = 5  # seconds
+        logger.info(f"Translation completed. Translated data saved to {output_file}")
+        return 0
 
-            for retry in range(max_retries):
-                try:
-                    translated_value = translate_func(value)
+    except Exception as e:
+        logger.error(f"Translation error: {str(e)}")
+        return 1
 
-                    # Also translate comments if they exist
-                    translated_comment = ""
-                    if row['comment']:
-                        # Add delay between value and comment translation
-                        time.sleep(1)
-                        translated_comment = translate_func(row['comment'])
+def _init_worker(log_level: int) -> None:
+    """Carry the parent's log level (e.g. --verbose) over to pool workers"""
+    logger.setLevel(log_level)
 
-                    row['value'] = translated_value
-                    row['comment'] = translated_comment
+def _worker_count(task_count: int) -> int:
+    """Number of worker processes to use for the given number of files"""
+    return max(1, min(os.cpu_count() or 1, task_count))
 
-                    # Success - return the row
-                    return row
-                except Exception as e:
-                    if retry < max_retries - 1:
-                        logger.warning(f"Translation failed for '{value}', retrying in {retry_delay} seconds... ({str(e)})")
-                        time.sleep(retry_delay)
-                        retry_delay *= 2  # Exponential backoff
-                    else:
-                        logger.error(f"Translation failed after {max_retries} attempts: {str(e)}")
-                        # Return the original row if all retries fail
-                        return row
-
-        for i in range(total_batches):
-            start_idx = i * batch_size
-            end_idx = min(start_idx + batch_size, len(rows))
-            batch = rows[start_idx:end_idx]
-
-            logger.info(f"Translating batch {i+1}/{total_batches} ({start_idx+1}-{end_idx} of {len(rows)})...")
-
-            # Process each item in the batch sequentially to avoid rate limits
-            translated_batch = []
-            for row in batch:
-                logger.info(f"Translating: '{row['key']}' - '{row['value']}'")
-                translated_row = translate_row(row)
-                translated_batch.append(translated_row)
-                progress_counter += 1
-
-                # Save progress after each row
-                all_rows = rows[:start_idx] + translated_batch + rows[start_idx + len(translated_batch):]
-                with open(temp_output_file, 'w', newline='', encoding='utf-8') as csvfile:
-                    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(all_rows)
-
-                # Add a delay between each row to avoid rate limits
-                time.sleep(delay)  # Configurable delay between individual items
-
-            # Update rows with translated batch
-            for j, translated_row in enumerate(translated_batch):
-                rows[start_idx + j] = translated_row
-
-            # Save progress after each batch
-            with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(rows)
-
-            # Add a longer delay between batches
-            if i < total_batches - 1:
-                delay = 2  # 5 seconds between batches
-                logger.info(f"Batch complete. Pausing for {delay} seconds before next batch...")
-                time.sleep(delay)
-
-        # Final save to the output file
-        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows)
-
-        # Remove the temporary file
-        if os.path.exists(temp_output_file):
-            os.remove(temp_output_file)
+# Strings to import, set once per worker process by _init_import_worker
+_import_data = {}
 
-        logger.info(f"Translation completed. Translated data saved to {output_file}")
-        return 0
+def _init_import_worker(log_level: int, string_data: Dict[Tuple[str, str], Tuple[str, str]]) -> None:
+    """Set up an import worker; the strings are sent once per process, not once per file"""
+    global _import_data
+    _init_worker(log_level)
+    _import_data = string_data
 
+def _update_resx_task(resx_file: str) -> None:
+    """Run update_resx_file in a worker process"""
+    try:
+        update_resx_file(resx_file, _import_data)
     except Exception as e:
-        logger.error(f"Translation error: {str(e)}")
-        return 1
+        # Parser errors (e.g. lxml's XMLSyntaxError) cannot always be pickled
+        # back to the parent process, so pass the message on instead
+        raise RuntimeError(str(e)) from None
 
 def export_strings(args):
     """Export strings from RESX files to CSV"""
@@ -595,24 +1029,25 @@ def export_strings(args):
         return 1
 
     # Find all RESX files
-    resx_files = find_resx_files(args.folder)
+    resx_files = list(find_resx_files(args.folder))
     if not resx_files:
         logger.warning(f"No .resx files found in {args.folder}")
         return 0
+    logger.info(f"Found {len(resx_files)} .resx files")
 
-    # Extract strings from all files
-    all_strings = []
-    for resx_file in resx_files:
-        strings = extract_strings_from_resx(resx_file)
-        all_strings.extend(strings)
+    # Extract strings from all files across CPU cores, and write each file's
+    # strings to the CSV as soon as they are ready
+    workers = _worker_count(len(resx_files))
+    chunksize = max(1, len(resx_files) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(logger.level,)) as executor:
+        count = export_to_csv(executor.map(_extract_table, resx_files, chunksize=chunksize), args.output)
 
-    if not all_strings:
-        logger.warning("No strings found in any .resx files")
+    if not count:
+        logger.warning(f"No strings found in any .resx files, {args.output} was not written")
         return 0
 
-    # Export to CSV
-    export_to_csv(all_strings, args.output)
-    logger.info(f"Successfully exported {len(all_strings)} strings to {args.output}")
+    logger.info(f"Successfully exported {count} strings to {args.output}")
     return 0
 
 def import_strings(args):
@@ -631,18 +1066,26 @@ def import_strings(args):
     success_count = 0
     error_count = 0
 
-    for resx_file, keys in string_data.items():
+    resx_files = []
+    for resx_file in dict.fromkeys(file_path for file_path, _ in string_data):
         if not os.path.isfile(resx_file):
             logger.warning(f"RESX file {resx_file} does not exist, skipping")
             error_count += 1
             continue
+        resx_files.append(resx_file)
 
-        try:
-            update_resx_file(resx_file, keys)
-            success_count += 1
-        except Exception as e:
-            error_count += 1
-            logger.error(f"Failed to update {resx_file}: {str(e)}")
+    if resx_files:
+        with ProcessPoolExecutor(max_workers=_worker_count(len(resx_files)), initializer=_init_import_worker,
+                                 initargs=(logger.level, string_data)) as executor:
+            futures = [(resx_file, executor.submit(_update_resx_task, resx_file)) for resx_file in resx_files]
+
+            for resx_file, future in futures:
+                try:
+                    future.result()
+                    success_count += 1
+                except Exception as e:
+                    error_count += 1
+                    logger.error(f"Failed to update {resx_file}: {str(e)}")
 
     logger.info(f"Import completed: {success_count} files updated successfully, {error_count} files failed")
     return 0 if error_count == 0 else 1
@@ -671,9 +1114,10 @@ def main():
     translate_parser.add_argument("--target", required=True, help="Target language code (e.g., 'es' for Google/DeepL or 'Spanish' for OpenAI)")
     translate_parser.add_argument("--api", choices=["google", "deepl", "openai"], required=True, help="Translation API to use")
     translate_parser.add_argument("--key", required=True, help="API key for the selected translation service")
-    translate_parser.add_argument("--batch-size", type=int, default=3, help="Number of strings to translate in a batch (default: 3)")
+    translate_parser.add_argument("--batch-size", type=int, default=3, help="Number of strings to translate per API request (default: 3)")
     translate_parser.add_argument("--delay", type=int, default=2, help="Delay between translations in seconds (default: 2)")
     translate_parser.add_argument("--start-at", type=int, default=0, help="Start translating from this row index (default: 0)")
+    translate_parser.add_argument("--concurrency", type=int, default=1, help=f"Number of batches to translate in parallel, at most {HTTP_POOL_SIZE} (default: 1)")
     translate_parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
 
     args = parser.parse_args()
@@ -687,7 +1131,7 @@ def main():
         return import_strings(args)
     elif args.command == "translate":
         return translate_csv(args.input, args.output, args.source, args.target, args.api, args.key,
-                            args.batch_size, args.delay, args.start_at)
+                            args.batch_size, args.delay, args.start_at, args.concurrency)
     else:
         parser.print_help()
         return 1